@@ -1,11 +1,16 @@
 from pathlib import Path
+import numpy as np
 from ladybug.hourlyplot import HourlyPlot
 from ladybug_geometry.geometry3d import Vector3D
 from ladybug.color import Color
-from .fromgeometry import from_line3d, from_polyline3d, from_mesh3d, to_text
+from .fromgeometry import from_polylines3d, to_text, to_texts
 from .model_dataset import ModelDataSet
 from .model import Model
 
+# vtkVectorText starts from left bottom so labels are moved to the left and down
+_LABEL_OFFSET = Vector3D(-5, -3, 0)
+_HOUR_LABEL_OFFSET = Vector3D(-15, -3, 0)
+
 
 def hourly_plot_to_vtkjs(self, output_folder: str, file_name: str = 'hourly plot') -> Path:
     """
@@ -21,52 +26,28 @@ def hourly_plot_to_vtkjs(self, output_folder: str, file_name: str = 'hourly plot
 
     datasets = []
 
-    lines = []
-    # hour lines
-    hour_lines3d_polydata = [line.to_polydata() for line in self.custom_hour_lines3d(
-        hour_labels=[0, 6, 12, 18, 24])]
-    lines.extend(hour_lines3d_polydata)
-
-    # month lines
-    month_lines3d_polydata = [line.to_polydata() for line in self.month_lines3d]
-    lines.extend(month_lines3d_polydata)
-
-    # border polyline
-    border_polydata = self.chart_border3d.to_polydata()
-    lines.append(border_polydata)
-    datasets.append(ModelDataSet('lines', lines, color=Color()))
-
-    # lalbels
-    labels = []
-    left_vector = Vector3D(-1, 0, 0)*5
-    down_vector = Vector3D(0, -1, 0)*3
-
-    # month labels
-    month_labels_polydata = [
-        to_text(label, self.month_label_points3d[count].
-                move(left_vector).move(down_vector), scale=4)
-        for count, label in enumerate(self.month_labels)]
-    labels.extend(month_labels_polydata)
-
-    # hour labels
-    hour_left_vector = Vector3D(-1, 0, 0)*15
-    hour_labels_polydata = [
-        to_text(label, self.hour_label_points3d[count].
-                move(hour_left_vector).move(down_vector), scale=4)
-        for count, label in enumerate(self.hour_labels)]
-    labels.extend(hour_labels_polydata)
-
-    # title text
-    title_polydata = to_text(self.title_text, self.lower_title_location.o.move(
-        left_vector).move(down_vector), scale=4)
-    labels.append(title_polydata)
+    # hour lines, month lines and the border polyline as a single polydata
+    lines = [*self.custom_hour_lines3d(hour_labels=[0, 6, 12, 18, 24]),
+             *self.month_lines3d, self.chart_border3d]
+    datasets.append(ModelDataSet('lines', [from_polylines3d(lines)], color=Color()))
+
+    # month labels, hour labels and the title
+    labels = [
+        to_texts(self.month_labels, self.month_label_points3d, scale=4,
+                 offset=_LABEL_OFFSET),
+        to_texts(self.hour_labels, self.hour_label_points3d, scale=4,
+                 offset=_HOUR_LABEL_OFFSET),
+        to_text(self.title_text, self.lower_title_location.o.move(_LABEL_OFFSET),
+                scale=4)
+    ]
     datasets.append(ModelDataSet('labels', labels, color=Color()))
 
     # data
     mesh_polydata = self.colored_mesh3d.to_polydata()
     mesh_dataset = ModelDataSet('data', [mesh_polydata])
     name = self.data_collection.header.data_type.name
-    mesh_dataset.add_data_fields([self.data_collection], name)
+    values = np.asarray(self.data_collection.values, dtype=np.float32)
+    mesh_dataset.add_data_fields([values], name)
     mesh_dataset.color_by = name
     datasets.append(mesh_dataset)
 
@@ -1,23 +1,106 @@
 """Extend Ladybug Core functionalities."""
 
 from pathlib import Path
+from itertools import chain
+from functools import lru_cache
 
 from typing import List
+import numpy as np
 from ladybug.color import Color
-from ladybug_geometry.geometry3d import Point3D
-from ladybug_geometry.geometry2d import Vector2D, Point2D
+from ladybug_geometry.geometry3d import Point3D, Vector3D
 from ladybug.sunpath import Sunpath
 from ladybug.compass import Compass
 from ladybug.datacollection import HourlyContinuousCollection
 
-from .fromgeometry import from_points3d, to_circle, to_text, from_points2d
+from .fromgeometry import from_points3d_array, from_polylines2d, from_polylines3d, \
+    from_arcs3d, to_circle, to_texts
+from .polydata import PolyData
+from .joined_polydata import JoinedPolyData
 from .model_dataset import ModelDataSet
 from .model import Model
 
 
+def _compass_polydata(radius: float, north_angle: float) -> tuple:
+    """Get the compass geometry as PolyData.
+
+    The compass only depends on the radius and the north angle so the geometry is
+    cached to avoid rebuilding it on every export. Each call gets new PolyData objects
+    so changing them does not change the cached geometry.
+
+    Returns:
+        A tuple with three PolyData for the circles and ticks, the minor labels and
+        the major labels.
+    """
+    copies = []
+    for polydata in _compass_geometry(radius, north_angle):
+        copy = PolyData()
+        copy.ShallowCopy(polydata)
+        copies.append(copy)
+    return tuple(copies)
+
+
+@lru_cache(maxsize=8)
+def _compass_geometry(radius: float, north_angle: float) -> tuple:
+    """Build the compass geometry. The result is cached and should not be edited.
+
+    Returns:
+        A tuple with three PolyData for the circles and ticks, the minor labels and
+        the major labels.
+    """
+    origin = Point3D()
+
+    # compass circles
+    offset_1 = (radius*1.5)/100
+    offset_2 = (radius*4.5)/100
+    rads = [radius, radius+offset_1, radius+offset_2]
+    base_polydata = [to_circle(origin, rad) for rad in rads]
+
+    # compass ticks
+    compass = Compass(radius=radius, north_angle=north_angle)
+    ticks_major = compass.ticks_from_angles(angles=compass.MAJOR_AZIMUTHS, factor=0.55)
+    ticks_minor = compass.ticks_from_angles(angles=compass.MINOR_AZIMUTHS)
+    base_polydata.append(from_polylines2d(ticks_major + ticks_minor))
+    joined_polydata = JoinedPolyData.from_polydata(base_polydata)
+    compass_polydata = PolyData()
+    compass_polydata.ShallowCopy(joined_polydata.GetOutput())
+
+    # Since vtkVectorText starts from left bottom we need to move the labels to the left
+    # and down by a certain amount.
+    moving_factor = (radius*3)/100
+    label_offset = Vector3D(-moving_factor, -moving_factor, 0)
+
+    # compass minor labels
+    minor_scale = (radius*2)/100
+    minor_text_polydata = to_texts(
+        compass.MINOR_TEXT, compass.minor_azimuth_points, minor_scale, label_offset)
+
+    # compass major labels
+    major_scale = (radius*5)/100
+    major_text_polydata = to_texts(
+        compass.MAJOR_TEXT, compass.major_azimuth_points, major_scale, label_offset)
+
+    return compass_polydata, minor_text_polydata, major_text_polydata
+
+
+def _monthly_polydata(sunpath: Sunpath, radius: float, make_2d: bool,
+                      arc_resolution: int = None) -> PolyData:
+    """Get the monthly arcs of a sunpath as a single PolyData.
+
+    See sunpath_to_vtkjs for the description of the arguments.
+    """
+    if make_2d:
+        return from_polylines2d(sunpath.monthly_day_polyline2d(radius=radius))
+
+    if arc_resolution is None:
+        arc_resolution = max(24, min(100, int(radius / 2)))
+    arcs = sunpath.monthly_day_arc3d(radius=radius)
+    return from_arcs3d(arcs, resolution=arc_resolution)
+
+
 def sunpath_to_vtkjs(self, output_folder: str = '.', file_name: str = 'sunpath', radius: int = 100,
                      data: List[HourlyContinuousCollection] = None,
-                     sun_color: Color = Color(252, 177, 3), make_2d: bool = False) -> Path:
+                     sun_color: Color = Color(252, 177, 3), make_2d: bool = False,
+                     arc_resolution: int = None) -> Path:
     """Export sunpath as a vtkjs file.
 
     Args:
@@ -29,6 +112,9 @@ def sunpath_to_vtkjs(self, output_folder: str = '.', file_name: str = 'sunpath',
         sun_color: A Ladybug Color object to color the suns.
             Defaults to Color(235, 33, 38).
         make_2d: Boolean to indicate whether to make the sunpath 2D. Defaults to False.
+        arc_resolution: Number of line segments for each monthly arc in the 3D
+            sunpath. Values smaller than 1 are set to 1. Defaults to None which will
+            scale the resolution with the radius between 24 and 100 segments.
 
     Returns:
         A pathlib Path object to the vtkjs file.
@@ -37,100 +123,72 @@ def sunpath_to_vtkjs(self, output_folder: str = '.', file_name: str = 'sunpath',
 
     # daily analemmas
     data = data or []
-    origin = Point3D()
 
     if not make_2d:
         polylines = self.hourly_analemma_polyline3d(radius=radius)
-        sp_polydata = [pl.to_polydata() for pl in polylines]
+        sp_polydata = [from_polylines3d(polylines)]
     else:
         polylines = self.hourly_analemma_polyline2d(radius=radius)
-        sp_polydata = [pl.to_polydata() for pl in polylines]
+        sp_polydata = [from_polylines2d(polylines)]
     sp_dataset = ModelDataSet(name='hourly_analemmas', data=sp_polydata, color=Color())
     datasets.append(sp_dataset)
 
     # monthly arcs
-    if not make_2d:
-        arcs = self.monthly_day_arc3d(radius=radius)
-        monthly_polydata = [arc.to_polydata(resolution=100) for arc in arcs]
-    else:
-        polylines = self.monthly_day_polyline2d(radius=radius)
-        monthly_polydata = [polyline.to_polydata() for polyline in polylines]
+    monthly_polydata = [_monthly_polydata(self, radius, make_2d, arc_resolution)]
     arc_dataset = ModelDataSet(name='monthly_arcs', data=monthly_polydata, color=Color())
     datasets.append(arc_dataset)
 
-    # compass circles
-    offset_1 = (radius*1.5)/100
-    offset_2 = (radius*4.5)/100
-    rads = [radius, radius+offset_1, radius+offset_2]
-    base_polydata = [to_circle(origin, radius) for radius in rads]
-
-    # compass ticks
-    compass = Compass(radius=radius, north_angle=self.north_angle)
-    ticks_major = compass.ticks_from_angles(angles=compass.MAJOR_AZIMUTHS, factor=0.55)
-    ticks_minor = compass.ticks_from_angles(angles=compass.MINOR_AZIMUTHS)
-    ticks_polydata = [tick.to_polydata() for tick in ticks_major+ticks_minor]
-    base_polydata.extend(ticks_polydata)
-    base_dataset = ModelDataSet(name='base_circle', data=base_polydata, color=Color())
+    # compass circles, ticks and labels
+    compass_polydata, minor_text_polydata, major_text_polydata = \
+        _compass_polydata(radius, self.north_angle)
+    base_dataset = ModelDataSet(
+        name='base_circle', data=[compass_polydata], color=Color())
     datasets.append(base_dataset)
-
-    # Since vtkVectorText starts from left bottom we need to move the labels to the left
-    # and down by a certain amount.
-    moving_factor = (radius*3)/100
-    left_vector = Vector2D(-1, 0)*moving_factor
-    down_vector = Vector2D(0, -1)*moving_factor
-
-    # compass minor labels
-    minor_scale = (radius*2)/100
-    minor_text_polydata = [to_text(text, compass.minor_azimuth_points[count].
-                                   move(left_vector).move(down_vector), minor_scale)
-                           for count, text in enumerate(compass.MINOR_TEXT)]
     minor_label_dataset = ModelDataSet(
-        name='minor_labels', data=minor_text_polydata, color=Color())
+        name='minor_labels', data=[minor_text_polydata], color=Color())
     datasets.append(minor_label_dataset)
-
-    # compass major labels
-    major_scale = (radius*5)/100
-    major_text_polydata = [to_text(text, compass.major_azimuth_points[count].
-                                   move(left_vector).move(down_vector), scale=major_scale) for
-                           count, text in enumerate(compass.MAJOR_TEXT)]
     major_label_dataset = ModelDataSet(
-        name='major_labels', data=major_text_polydata, color=Color())
+        name='major_labels', data=[major_text_polydata], color=Color())
     datasets.append(major_label_dataset)
 
     # add suns
-    day = self.hourly_analemma_suns(daytime_only=True)
-
-    # calculate sun positions from sun vector
-    pts = []
-    hours = []
-    for suns in day:
-        for sun in suns:
-            if not make_2d:
-                pts.append(origin.move(sun.sun_vector.reverse() * radius))
-            else:
-                pts.append(origin.move(sun.sun_vector.reverse() * radius))
-            hours.append(sun.hoy)
-
-    if not make_2d:
-        sun_positions = from_points3d(pts)
-    else:
-        sun_positions = from_points2d(pts)
+    suns = tuple(chain.from_iterable(self.hourly_analemma_suns(daytime_only=True)))
+    hours = [sun.hoy for sun in suns]
+
+    # calculate sun positions from sun vectors
+    sun_vectors = np.fromiter(
+        chain.from_iterable(sun.sun_vector for sun in suns), dtype=np.float64,
+        count=3 * len(suns)
+    ).reshape(-1, 3)
+    # the sunpath is drawn around the world origin so the sun positions are the
+    # reversed sun vectors scaled by the radius
+    sun_points = sun_vectors * -radius
+    if make_2d:
+        sun_points[:, 2] = 0
+
+    sun_positions = from_points3d_array(sun_points)
     sun_dataset = ModelDataSet(name='suns', data=[sun_positions])
+    datasets.append(sun_dataset)
 
     # Load data if provided
     if data:
+        invalid = next(
+            (dt for dt in data if not isinstance(dt, HourlyContinuousCollection)), None)
+        assert invalid is None, 'Data needs to be a Ladybug ' \
+            f'HourlyContinuousCollection object. Instead got {type(invalid)}'
+        # sun hours are whole hours so they can be used to index annual data directly
+        hoy_idx = np.asarray(hours, dtype=np.int64)
         for dt in data:
-            assert isinstance(dt, HourlyContinuousCollection), 'Data needs to be a'\
-                f' Ladybug HourlyContinuousCollection object. Instead got {type(dt)}'
-            filtered_data = dt.filter_by_hoys(hours)
-            name = filtered_data.header.data_type.name
-            sun_dataset.add_data_fields([filtered_data], name, per_face=False)
+            a_period = dt.header.analysis_period
+            if a_period.is_annual:
+                values = np.asarray(dt.values)[hoy_idx * a_period.timestep]
+            else:
+                values = np.asarray(dt.filter_by_hoys(hours).values)
+            name = dt.header.data_type.name
+            sun_dataset.add_data_fields([values], name, per_face=False)
             sun_dataset.color_by = name
-        datasets.append(sun_dataset)
     else:
-        sun_dataset = ModelDataSet(
-            name='suns', data=[sun_positions], color=sun_color)
-        datasets.append(sun_dataset)
+        sun_dataset.color = sun_color
 
     # join polylines into a single polydata
     sunpath = Model(datasets=datasets)
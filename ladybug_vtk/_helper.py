@@ -1,5 +1,6 @@
 """Helper functions to be used in other modules."""
 
+import numpy as np
 from typing import Any, Union, List, Tuple
 
 
@@ -22,7 +23,32 @@ def validate_input(val: Union[List, Tuple], val_type: List[Any], max_val: int =
     """
     if num_val:
         assert len(val) == num_val, f'Length of val must be {num_val}'
+    val_type = tuple(val_type)
     if max_val:
-        return all(list(map(lambda v: isinstance(v, tuple(val_type)) and v < max_val, val)))
+        return all(isinstance(v, val_type) and v < max_val for v in val)
     else:
-        return all(list(map(lambda v: isinstance(v, tuple(val_type)), val)))
+        return all(isinstance(v, val_type) for v in val)
+
+
+def to_vtk_array(values: np.ndarray, array_type: type, components: int = 1):
+    """Copy a numpy array into a new VTK data array.
+
+    This is a lighter alternative to vtk.util.numpy_support.numpy_to_vtk which has
+    a considerable overhead for the small arrays that are common in this library.
+    The values are copied so the VTK array owns its memory.
+
+    Args:
+        values: A C-contiguous numpy array. The dtype of the array must match the
+            data type of the array_type.
+        array_type: A VTK data array class (e.g. vtk.vtkFloatArray).
+        components: Number of components per tuple. Defaults to 1.
+
+    Returns:
+        A VTK data array of the input array_type.
+    """
+    view = array_type()
+    view.SetNumberOfComponents(components)
+    view.SetVoidArray(values, values.size, 1)
+    array = array_type()
+    array.DeepCopy(view)
+    return array
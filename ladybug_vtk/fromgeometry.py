@@ -3,11 +3,77 @@
 
 import vtk
 import math
+import numpy as np
+from itertools import chain
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Union
+from vtk.util.numpy_support import ID_TYPE_CODE, vtk_to_numpy
 from ladybug_geometry.geometry2d import Point2D, LineSegment2D, Polyline2D
 from ladybug_geometry.geometry3d import Point3D, Polyline3D, Arc3D, LineSegment3D,\
-    Mesh3D, Polyface3D, Cone, Cylinder, Sphere, Face3D
+    Mesh3D, Polyface3D, Cone, Cylinder, Sphere, Face3D, Vector3D
 from .polydata import PolyData
+from ._helper import to_vtk_array
+
+
+def _to_vtk_points(points: np.ndarray) -> vtk.vtkPoints:
+    """Create vtkPoints from an array of point coordinates.
+
+    Args:
+        points: A numpy array of shape (N, 3) with the x, y and z coordinates of
+            the points.
+
+    Returns:
+        A vtkPoints object. The coordinates are stored as 32-bit floats which is
+        the default precision for vtkPoints.
+    """
+    vtk_points = vtk.vtkPoints()
+    vtk_points.SetData(to_vtk_array(
+        np.ascontiguousarray(points, dtype=np.float32), vtk.vtkFloatArray, 3))
+    return vtk_points
+
+
+def _to_vtk_cell_array(offsets: np.ndarray, connectivity: np.ndarray) -> vtk.vtkCellArray:
+    """Create a vtkCellArray from offsets and connectivity arrays.
+
+    Args:
+        offsets: A numpy array with the starting index of each cell in the
+            connectivity array followed by the length of the connectivity array.
+        connectivity: A numpy array of point indices for all the cells.
+
+    Returns:
+        A vtkCellArray object.
+    """
+    offsets = np.ascontiguousarray(offsets, dtype=ID_TYPE_CODE)
+    connectivity = np.ascontiguousarray(connectivity, dtype=ID_TYPE_CODE)
+    cells = vtk.vtkCellArray()
+    cells.SetData(to_vtk_array(offsets, vtk.vtkIdTypeArray),
+                  to_vtk_array(connectivity, vtk.vtkIdTypeArray))
+    return cells
+
+
+def _to_vtk_polygons(sizes: List[int], connectivity: np.ndarray) -> vtk.vtkCellArray:
+    """Create a vtkCellArray of polygons from their sizes and connectivity.
+
+    If all the polygons have the same size, e.g. in a triangulated mesh, the
+    offsets are not created and VTK uses the cell size to find the cells.
+
+    Args:
+        sizes: A list with the number of points of each polygon.
+        connectivity: A numpy array of point indices for all the polygons.
+
+    Returns:
+        A vtkCellArray object.
+    """
+    if len(set(sizes)) == 1:
+        cells = vtk.vtkCellArray()
+        cells.SetData(sizes[0], to_vtk_array(
+            np.ascontiguousarray(connectivity, dtype=ID_TYPE_CODE), vtk.vtkIdTypeArray))
+        return cells
+
+    offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    return _to_vtk_cell_array(offsets, connectivity)
 
 
 def from_point2d(point: Point2D) -> PolyData:
@@ -23,42 +89,62 @@ def from_point2d(point: Point2D) -> PolyData:
     vtk_vertice = vtk.vtkCellArray()
 
     vtk_point.InsertNextPoint(point.x, point.y, 0)
-    vtk_vertice.InsertNextCell(1, [1])
+    vtk_vertice.InsertNextCell(1, [0])
 
     polydata = PolyData()
     polydata.SetPoints(vtk_point)
     polydata.SetVerts(vtk_vertice)
-    polydata.Modified()
 
     return polydata
 
 
-def _polyline_from_points(points: List[Point2D]) -> PolyData:
-    """Create Polydata from a list of Ladybug Point2D objects.
+def _points2d_to_array(points: List[Point2D]) -> np.ndarray:
+    """Get an (N, 3) array of point coordinates from Ladybug Point2D objects.
+
+    The z coordinate of all the points is set to 0.
+    """
+    array = np.zeros((len(points), 3))
+    array[:, :2] = np.fromiter(
+        chain.from_iterable(map(attrgetter('x', 'y'), points)),
+        dtype=np.float64, count=2 * len(points)
+    ).reshape(-1, 2)
+    return array
+
+
+def _polylines_from_array(points: np.ndarray, offsets: np.ndarray = None) -> PolyData:
+    """Create Polydata with polylines from an array of point coordinates.
+
+    This is the shared kernel for all the 2D and 3D polyline translators.
 
     Args:
-        points: A list of Ladybug Point2D objects.
+        points: A numpy array of shape (N, 3) with the x, y and z coordinates of
+            the polyline vertices.
+        offsets: An optional array with the index of the first point of each
+            polyline followed by the total number of points. If not provided all
+            the points are joined into a single polyline.
 
     Returns:
-        Polydata containing a polyline created by joining the points.
+        Polydata containing the polylines.
     """
-    pts = vtk.vtkPoints()
-    for point in points:
-        pts.InsertNextPoint(point.x, point.y, 0)
+    if offsets is None:
+        offsets = (0, len(points))
+    polydata = PolyData()
+    polydata.SetPoints(_to_vtk_points(points))
+    polydata.SetLines(_to_vtk_cell_array(offsets, np.arange(offsets[-1])))
 
-    polyline = vtk.vtkPolyLine()
-    polyline.GetPointIds().SetNumberOfIds(len(points))
-    for i in range(len(points)):
-        polyline.GetPointIds().SetId(i, i)
+    return polydata
 
-    cells = vtk.vtkCellArray()
-    cells.InsertNextCell(polyline)
 
-    polydata = PolyData()
-    polydata.SetPoints(pts)
-    polydata.SetLines(cells)
+def _polyline_from_points(points: List[Point2D]) -> PolyData:
+    """Create Polydata from a list of Ladybug Point2D objects.
 
-    return polydata
+    Args:
+        points: A list of Ladybug Point2D objects.
+
+    Returns:
+        Polydata containing a polyline created by joining the points.
+    """
+    return _polylines_from_array(_points2d_to_array(points))
 
 
 def from_points2d(points: List[Point2D], join: bool = False) -> PolyData:
@@ -74,20 +160,7 @@ def from_points2d(points: List[Point2D], join: bool = False) -> PolyData:
     if join:
         return _polyline_from_points(points)
 
-    vtk_points = vtk.vtkPoints()
-    vtk_vertices = vtk.vtkCellArray()
-
-    for point in points:
-        vtk_points.InsertNextPoint(point.x, point.y, 0)
-
-    vtk_vertices.InsertNextCell(len(points), list(range(len(points))))
-
-    polydata = PolyData()
-    polydata.SetPoints(vtk_points)
-    polydata.SetVerts(vtk_vertices)
-    polydata.Modified()
-
-    return polydata
+    return from_points3d_array(_points2d_to_array(points))
 
 
 def from_line2d(line: LineSegment2D) -> PolyData:
@@ -114,6 +187,26 @@ def from_polyline2d(polyline: Polyline2D) -> PolyData:
     return from_points2d(polyline.vertices, join=True)
 
 
+def from_polylines2d(polylines: List[Union[Polyline2D, LineSegment2D]]) -> PolyData:
+    """Create a single Polydata from a list of Ladybug Polyline2D objects.
+
+    Each polyline is added as a separate line in the Polydata. This is much faster
+    than creating a Polydata per polyline when the polylines are going to be
+    exported together.
+
+    Args:
+        polylines: A list of Ladybug Polyline2D or LineSegment2D objects.
+
+    Returns:
+        Polydata containing all the polylines.
+    """
+    vertices = [polyline.vertices for polyline in polylines]
+    offsets = np.zeros(len(vertices) + 1, dtype=np.int64)
+    np.cumsum([len(verts) for verts in vertices], out=offsets[1:])
+    points = _points2d_to_array(list(chain.from_iterable(vertices)))
+    return _polylines_from_array(points, offsets)
+
+
 def from_point3d(point: Point3D) -> PolyData:
     """Create Polydata from a Ladybug Point3D object.
 
@@ -126,17 +219,24 @@ def from_point3d(point: Point3D) -> PolyData:
     vtk_point = vtk.vtkPoints()
     vtk_vertice = vtk.vtkCellArray()
 
-    vtk_point.InsertNextPoint(tuple(point))
-    vtk_vertice.InsertNextCell(1, [1])
+    vtk_point.InsertNextPoint(point.x, point.y, point.z)
+    vtk_vertice.InsertNextCell(1, [0])
 
     polydata = PolyData()
     polydata.SetPoints(vtk_point)
     polydata.SetVerts(vtk_vertice)
-    polydata.Modified()
 
     return polydata
 
 
+def _points3d_to_array(points: List[Union[Point3D, Vector3D]]) -> np.ndarray:
+    """Get an (N, 3) array of coordinates from Ladybug Point3D or Vector3D objects."""
+    return np.fromiter(
+        chain.from_iterable(map(attrgetter('x', 'y', 'z'), points)),
+        dtype=np.float64, count=3 * len(points)
+    ).reshape(-1, 3)
+
+
 def _polyline_from_points3d(points: List[Point3D]) -> PolyData:
     """Create Polydata from a list of Ladybug Point3D objects.
 
@@ -146,23 +246,7 @@ def _polyline_from_points3d(points: List[Point3D]) -> PolyData:
     Returns:
         Polydata containing a polyline created by joining the points.
     """
-    pts = vtk.vtkPoints()
-    for pt in points:
-        pts.InsertNextPoint(tuple(pt))
-
-    polyline = vtk.vtkPolyLine()
-    polyline.GetPointIds().SetNumberOfIds(len(points))
-    for i in range(len(points)):
-        polyline.GetPointIds().SetId(i, i)
-
-    cells = vtk.vtkCellArray()
-    cells.InsertNextCell(polyline)
-
-    polydata = PolyData()
-    polydata.SetPoints(pts)
-    polydata.SetLines(cells)
-
-    return polydata
+    return _polylines_from_array(_points3d_to_array(points))
 
 
 def from_points3d(points: List[Point3D], join: bool = False) -> PolyData:
@@ -178,18 +262,26 @@ def from_points3d(points: List[Point3D], join: bool = False) -> PolyData:
     if join:
         return _polyline_from_points3d(points)
 
-    vtk_points = vtk.vtkPoints()
-    vtk_vertices = vtk.vtkCellArray()
+    return from_points3d_array(_points3d_to_array(points))
+
 
-    for point in points:
-        vtk_points.InsertNextPoint(tuple(point))
+def from_points3d_array(points: np.ndarray) -> PolyData:
+    """Create Polydata from an array of point coordinates.
 
-    vtk_vertices.InsertNextCell(len(points), list(range(len(points))))
+    This is a faster alternative to from_points3d when the coordinates are already
+    available as a numpy array since no Ladybug Point3D objects are needed.
+
+    Args:
+        points: A numpy array of shape (N, 3) with the x, y and z coordinates of
+            the points.
 
+    Returns:
+        Polydata containing all points.
+    """
+    count = len(points)
     polydata = PolyData()
-    polydata.SetPoints(vtk_points)
-    polydata.SetVerts(vtk_vertices)
-    polydata.Modified()
+    polydata.SetPoints(_to_vtk_points(points))
+    polydata.SetVerts(_to_vtk_cell_array((0, count), np.arange(count)))
 
     return polydata
 
@@ -218,35 +310,74 @@ def from_polyline3d(polyline: Polyline3D) -> PolyData:
     return from_points3d(polyline.vertices, join=True)
 
 
+def from_polylines3d(polylines: List[Union[Polyline3D, LineSegment3D]]) -> PolyData:
+    """Create a single Polydata from a list of Ladybug Polyline3D objects.
+
+    Each polyline is added as a separate line in the Polydata. This is much faster
+    than creating a Polydata per polyline when the polylines are going to be
+    exported together.
+
+    Args:
+        polylines: A list of Ladybug Polyline3D or LineSegment3D objects.
+
+    Returns:
+        Polydata containing all the polylines.
+    """
+    vertices = [polyline.vertices for polyline in polylines]
+    offsets = np.zeros(len(vertices) + 1, dtype=np.int64)
+    np.cumsum([len(verts) for verts in vertices], out=offsets[1:])
+    points = _points3d_to_array(list(chain.from_iterable(vertices)))
+    return _polylines_from_array(points, offsets)
+
+
 def from_arc3d(arc3d: Arc3D, resolution: int = 25) -> PolyData:
     """Create Polydata from a Ladybug Arc3D object.
 
     Args:
         arc3d: A Ladybug Arc3D object.
         resolution: The number of segments into which the arc will be divided.
-            Defaults to 25.
+            Values smaller than 1 are set to 1. Defaults to 25.
 
     Returns:
         Polydata containing an arc.
     """
-    arc = vtk.vtkArcSource()
-    arc.UseNormalAndAngleOn()
-    arc.SetCenter(arc3d.c.x, arc3d.c.y, arc3d.c.z)
-    polar_vector = LineSegment3D.from_end_points(arc3d.c, arc3d.p1).v
-    arc.SetPolarVector(round(polar_vector.x, 2), round(
-        polar_vector.y, 2), round(polar_vector.z, 2))
-    normal = arc3d.plane.n
-    arc.SetNormal(round(normal.x, 2), round(normal.y, 2), round(normal.z, 2))
-    arc.SetAngle(math.degrees(arc3d.angle))
-    arc.SetResolution(resolution)
-    arc.Update()
+    return from_arcs3d([arc3d], resolution)
 
-    polydata = PolyData()
-    polydata.ShallowCopy(arc.GetOutput())
 
-    # delete the array named 'Texture Coordinates' that's generated automatically for some reason
-    polydata.GetPointData().RemoveArray('Texture Coordinates')
-    return polydata
+def from_arcs3d(arcs: List[Arc3D], resolution: int = 25) -> PolyData:
+    """Create a single Polydata from a list of Ladybug Arc3D objects.
+
+    The points of all the arcs are calculated together using numpy and each arc is
+    added as a separate line in the Polydata.
+
+    Args:
+        arcs: A list of Ladybug Arc3D objects.
+        resolution: The number of segments into which each arc will be divided.
+            Values smaller than 1 are set to 1. Defaults to 25.
+
+    Returns:
+        Polydata containing all the arcs.
+    """
+    # an arc needs at least one segment, the same as in vtkArcSource
+    resolution = max(int(resolution), 1)
+    count = len(arcs)
+    centers = _points3d_to_array([arc.c for arc in arcs])
+    x_axes = _points3d_to_array([arc.plane.x for arc in arcs])
+    y_axes = _points3d_to_array([arc.plane.y for arc in arcs])
+    radii = np.array([arc.radius for arc in arcs], dtype=np.float64)
+    start_angles = np.array([arc.a1 for arc in arcs], dtype=np.float64)
+    angles = np.array([arc.angle for arc in arcs], dtype=np.float64)
+
+    # angle of each point in the plane of its arc with a shape of (count, resolution + 1)
+    theta = start_angles[:, None] + \
+        np.linspace(0, 1, resolution + 1)[None, :] * angles[:, None]
+    points = centers[:, None, :] + radii[:, None, None] * (
+        np.cos(theta)[..., None] * x_axes[:, None, :] +
+        np.sin(theta)[..., None] * y_axes[:, None, :]
+    )
+
+    offsets = np.arange(count + 1) * (resolution + 1)
+    return _polylines_from_array(points.reshape(-1, 3), offsets)
 
 
 def from_mesh3d(mesh: Mesh3D) -> PolyData:
@@ -258,22 +389,15 @@ def from_mesh3d(mesh: Mesh3D) -> PolyData:
     Returns:
         Polydata containing face and points of a mesh.
     """
-    points = vtk.vtkPoints()
-    polygon = vtk.vtkPolygon()
-    cells = vtk.vtkCellArray()
-
-    for ver in mesh.vertices:
-        points.InsertNextPoint(*ver)
-
-    for face in mesh.faces:
-        polygon.GetPointIds().SetNumberOfIds(len(face))
-        for count, i in enumerate(face):
-            polygon.GetPointIds().SetId(count, i)
-        cells.InsertNextCell(polygon)
+    points = _to_vtk_points(_points3d_to_array(mesh.vertices))
+    faces = mesh.faces
+    sizes = [len(face) for face in faces]
+    connectivity = np.fromiter(
+        chain.from_iterable(faces), dtype=np.int64, count=sum(sizes))
 
     polydata = PolyData()
     polydata.SetPoints(points)
-    polydata.SetPolys(cells)
+    polydata.SetPolys(_to_vtk_polygons(sizes, connectivity))
 
     return polydata
 
@@ -287,25 +411,59 @@ def from_face3d(face: Face3D) -> PolyData:
     Returns:
         Polydata containing face and points of a face.
     """
+    vertices = face.vertices
+    vertices_count = len(vertices)
 
-    if face.has_holes or not face.is_convex:
+    # triangles are always convex so there is no need to check for convexity
+    if face.has_holes or (vertices_count > 3 and not face.is_convex):
         return from_mesh3d(face.triangulated_mesh3d)
 
-    points = vtk.vtkPoints()
-    polygon = vtk.vtkPolygon()
-    cells = vtk.vtkCellArray()
-
-    vertices_count = len(face.vertices)
-    polygon.GetPointIds().SetNumberOfIds(vertices_count)
-    for ver in face.vertices:
-        points.InsertNextPoint(*ver)
-    for count in range(vertices_count):
-        polygon.GetPointIds().SetId(count, count)
-    cells.InsertNextCell(polygon)
+    points = _to_vtk_points(_points3d_to_array(vertices))
 
     polydata = PolyData()
     polydata.SetPoints(points)
-    polydata.SetPolys(cells)
+    polydata.SetPolys(
+        _to_vtk_cell_array((0, vertices_count), np.arange(vertices_count)))
+
+    return polydata
+
+
+def from_faces3d(faces: List[Face3D]) -> PolyData:
+    """Create a single Polydata from a list of Ladybug Face3D objects.
+
+    Each face is added the same way as in from_face3d. This is much faster than
+    creating a Polydata per face when the faces are going to be exported together.
+
+    Args:
+        faces: A list of Ladybug Face3D objects.
+
+    Returns:
+        Polydata containing all the faces.
+    """
+    vertices, polygons, bases = [], [], []
+    for face in faces:
+        face_vertices = face.vertices
+        vertices_count = len(face_vertices)
+        if face.has_holes or (vertices_count > 3 and not face.is_convex):
+            mesh = face.triangulated_mesh3d
+            face_vertices, face_polygons = mesh.vertices, mesh.faces
+        else:
+            face_polygons = (range(vertices_count),)
+        bases.extend([len(vertices)] * len(face_polygons))
+        vertices.extend(face_vertices)
+        polygons.extend(face_polygons)
+
+    sizes = [len(polygon) for polygon in polygons]
+    # polygon indices are local to their face and are shifted by the number of
+    # vertices of the faces before them
+    connectivity = np.fromiter(
+        chain.from_iterable(polygons), dtype=np.int64, count=sum(sizes)
+    ) + np.repeat(np.asarray(bases, dtype=np.int64), sizes)
+    points = _points3d_to_array(vertices)
+
+    polydata = PolyData()
+    polydata.SetPoints(_to_vtk_points(points))
+    polydata.SetPolys(_to_vtk_polygons(sizes, connectivity))
 
     return polydata
 
@@ -322,6 +480,31 @@ def from_polyface3d(polyface: Polyface3D) -> List[PolyData]:
     return [from_face3d(face) for face in polyface.faces]
 
 
+def _moved_copy(polydata: vtk.vtkPolyData, center: Point3D) -> PolyData:
+    """Copy a cached primitive that is built at the origin and move it to center."""
+    moved = PolyData()
+    moved.DeepCopy(polydata)
+    points = vtk_to_numpy(polydata.GetPoints().GetData()) + tuple(center)
+    moved.SetPoints(_to_vtk_points(points))
+    return moved
+
+
+@lru_cache(maxsize=64)
+def _cone_at_origin(radius: float, height: float, direction: tuple, resolution: int,
+                    cap: bool) -> vtk.vtkPolyData:
+    """Get a cone at the origin. The result is cached and should not be edited."""
+    cone_source = vtk.vtkConeSource()
+    cone_source.SetResolution(resolution)
+    cone_source.SetRadius(radius)
+    cone_source.SetHeight(height)
+    cone_source.SetDirection(direction)
+    cone_source.SetCenter(0, 0, 0)
+    if not cap:
+        cone_source.CappingOff()
+    cone_source.Update()
+    return cone_source.GetOutput()
+
+
 def from_cone(cone: Cone, resolution: int = 2, cap: bool = True) -> PolyData:
     """Create Polydata from a Ladybug Cone.
 
@@ -338,22 +521,22 @@ def from_cone(cone: Cone, resolution: int = 2, cap: bool = True) -> PolyData:
     Returns:
         Polydata containing a cone.
     """
-
-    cone_source = vtk.vtkConeSource()
-    cone_source.SetResolution(resolution)
-    cone_source.SetRadius(cone.radius)
-    cone_source.SetHeight(cone.height)
-    cone_source.SetDirection(tuple(cone.axis))
+    polydata = _cone_at_origin(
+        cone.radius, cone.height, tuple(cone.axis), resolution, cap)
     center = cone.vertex.move(cone.axis.reverse())
-    cone_source.SetCenter(tuple(center))
-    if not cap:
-        cone_source.CappingOff()
-    cone_source.Update()
+    return _moved_copy(polydata, center)
 
-    polydata = PolyData()
-    polydata.ShallowCopy(cone_source.GetOutput())
 
-    return polydata
+@lru_cache(maxsize=64)
+def _sphere_at_origin(radius: float, resolution: int) -> vtk.vtkPolyData:
+    """Get a sphere at the origin. The result is cached and should not be edited."""
+    sphere_source = vtk.vtkSphereSource()
+    sphere_source.SetCenter(0, 0, 0)
+    sphere_source.SetRadius(radius)
+    sphere_source.SetPhiResolution(resolution)
+    sphere_source.SetThetaResolution(resolution)
+    sphere_source.Update()
+    return sphere_source.GetOutput()
 
 
 def from_sphere(sphere: Sphere, resolution: int = 25) -> PolyData:
@@ -367,18 +550,23 @@ def from_sphere(sphere: Sphere, resolution: int = 25) -> PolyData:
     Returns:
         Polydata containing a sphere.
     """
+    polydata = _sphere_at_origin(sphere.radius, resolution)
+    return _moved_copy(polydata, sphere.center)
 
-    sphere_source = vtk.vtkSphereSource()
-    sphere_source.SetCenter(tuple(sphere.center))
-    sphere_source.SetRadius(sphere.radius)
-    sphere_source.SetPhiResolution(resolution)
-    sphere_source.SetThetaResolution(resolution)
-    sphere_source.Update()
-
-    polydata = PolyData()
-    polydata.ShallowCopy(sphere_source.GetOutput())
 
-    return polydata
+@lru_cache(maxsize=64)
+def _cylinder_at_origin(radius: float, height: float, resolution: int,
+                        cap: bool) -> vtk.vtkPolyData:
+    """Get a cylinder at the origin. The result is cached and should not be edited."""
+    cylinder_source = vtk.vtkCylinderSource()
+    cylinder_source.SetCenter(0, 0, 0)
+    cylinder_source.SetRadius(radius)
+    cylinder_source.SetHeight(height)
+    cylinder_source.SetResolution(resolution)
+    if not cap:
+        cylinder_source.CappingOff()
+    cylinder_source.Update()
+    return cylinder_source.GetOutput()
 
 
 def from_cylinder(cylinder: Cylinder, resolution: int = 25, cap: bool = True) -> PolyData:
@@ -394,20 +582,9 @@ def from_cylinder(cylinder: Cylinder, resolution: int = 25, cap: bool = True) ->
     Returns:
         Polydata containing a cylinder.
     """
-
-    cylinder_source = vtk.vtkCylinderSource()
-    cylinder_source.SetCenter(tuple(cylinder.center))
-    cylinder_source.SetRadius(cylinder.radius)
-    cylinder_source.SetHeight(cylinder.height)
-    cylinder_source.SetResolution(resolution)
-    if not cap:
-        cylinder_source.CappingOff()
-    cylinder_source.Update()
-
-    polydata = PolyData()
-    polydata.ShallowCopy(cylinder_source.GetOutput())
-
-    return polydata
+    polydata = _cylinder_at_origin(
+        cylinder.radius, cylinder.height, resolution, cap)
+    return _moved_copy(polydata, cylinder.center)
 
 
 def to_circle(center: Point3D, radius: int = 100, sides: int = 100) -> PolyData:
@@ -421,18 +598,46 @@ def to_circle(center: Point3D, radius: int = 100, sides: int = 100) -> PolyData:
     Returns:
         A Polydata object containing a circle.
     """
-    polygonSource = vtk.vtkRegularPolygonSource()
-    polygonSource.GeneratePolygonOff()
-    polygonSource.SetNumberOfSides(sides)
-    polygonSource.SetRadius(radius)
-    polygonSource.SetCenter(center.x, center.y, center.z)
-    polygonSource.Update()
+    # start from the y axis and go clockwise to match vtkRegularPolygonSource
+    theta = np.linspace(0, 2 * math.pi, sides, endpoint=False)
+    points = np.empty((sides, 3), dtype=np.float64)
+    points[:, 0] = center.x + radius * np.sin(theta)
+    points[:, 1] = center.y + radius * np.cos(theta)
+    points[:, 2] = center.z
 
     polydata = PolyData()
-    polydata.ShallowCopy(polygonSource.GetOutput())
+    polydata.SetPoints(_to_vtk_points(points))
+    polydata.SetLines(_to_vtk_cell_array((0, sides + 1), np.arange(sides + 1) % sides))
     return polydata
 
 
+@lru_cache(maxsize=256)
+def _vector_text(text: str) -> tuple:
+    """Get the geometry of a text string from vtkVectorText.
+
+    The result is cached so the text functions only need to scale and move the
+    glyphs for repeated labels.
+
+    Returns:
+        A tuple with an (N, 3) array of points, the cell offsets and the cell
+        connectivity of the text polygons.
+    """
+    # each call uses its own source so concurrent callers never share its output
+    vector_text = vtk.vtkVectorText()
+    vector_text.SetText(text)
+    vector_text.Update()
+    output = vector_text.GetOutput()
+    polys = output.GetPolys()
+    geometry = (
+        vtk_to_numpy(output.GetPoints().GetData()).astype(np.float64),
+        vtk_to_numpy(polys.GetOffsetsArray()).copy(),
+        vtk_to_numpy(polys.GetConnectivityArray()).copy()
+    )
+    for array in geometry:
+        array.flags.writeable = False
+    return geometry
+
+
 def to_text(text: str, point: Union[Point3D, Point2D], scale: float = 2) -> PolyData:
     """Create a VTK text object from a text string and a ladybug Point3D.
 
@@ -445,21 +650,51 @@ def to_text(text: str, point: Union[Point3D, Point2D], scale: float = 2) -> Poly
     Returns:
         A Polydata object containing the text.
     """
-    source = vtk.vtkVectorText()
-    source.SetText(text)
+    points, offsets, connectivity = _vector_text(text)
+    z = point.z if isinstance(point, Point3D) else 0
+
+    polydata = PolyData()
+    polydata.SetPoints(_to_vtk_points(points * scale + (point.x, point.y, z)))
+    polydata.SetPolys(_to_vtk_cell_array(offsets, connectivity))
+    return polydata
+
 
-    translation = vtk.vtkTransform()
-    if isinstance(point, Point3D):
-        translation.Translate(point.x, point.y, point.z)
-    else:
-        translation.Translate(point.x, point.y, 0)
-    translation.Scale(scale, scale, scale)
+def to_texts(texts: List[str], points: List[Union[Point3D, Point2D]],
+             scale: float = 2, offset: Vector3D = None) -> PolyData:
+    """Create a single VTK text object from a list of text strings and points.
 
-    transformFilter = vtk.vtkTransformPolyDataFilter()
-    transformFilter.SetInputConnection(source.GetOutputPort())
-    transformFilter.SetTransform(translation)
-    transformFilter.Update()
+    This method moves the cached geometry of each text in place and writes all the
+    texts into one Polydata which is much faster than calling to_text for each text
+    separately.
+
+    Args:
+        texts: A list of text strings.
+        points: A list of ladybug Point3D or Point2D objects. There should be a point
+            per text. This is the location in 3D space of each text.
+        scale: The scale of the texts. Defaults to 2.
+        offset: An optional ladybug Vector3D to move all the texts by. This is applied
+            while placing each text so the input points are not copied. Defaults to
+            None.
+
+    Returns:
+        A Polydata object containing all the texts.
+    """
+    dx, dy, dz = offset or (0, 0, 0)
+    text_points = [np.zeros((0, 3))]
+    text_offsets = [np.zeros(1, dtype=np.int64)]
+    text_connectivity = [np.zeros(0, dtype=np.int64)]
+    point_count = cell_count = 0
+    for text, point in zip(texts, points):
+        pts, offsets, connectivity = _vector_text(text)
+        z = point.z if isinstance(point, Point3D) else 0
+        text_points.append(pts * scale + (point.x + dx, point.y + dy, z + dz))
+        text_offsets.append(offsets[1:] + cell_count)
+        text_connectivity.append(connectivity + point_count)
+        point_count += len(pts)
+        cell_count += offsets[-1]
 
     polydata = PolyData()
-    polydata.ShallowCopy(transformFilter.GetOutput())
+    polydata.SetPoints(_to_vtk_points(np.concatenate(text_points)))
+    polydata.SetPolys(_to_vtk_cell_array(
+        np.concatenate(text_offsets), np.concatenate(text_connectivity)))
     return polydata
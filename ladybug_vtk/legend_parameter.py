@@ -19,10 +19,6 @@ decimal_count = {'decimal_two': '%#6.2f', 'decimal_three': '%-#6.3f',
                  'default': '%-#6.3g', 'integer': '%4.3g'}
 
 
-decimal_count = {'decimal_two': '%#6.2f', 'decimal_three': '%-#6.3f',
-                 'default': '%-#6.3g', 'integer': '%4.3g'}
-
-
 class Orientation(Enum):
     """Orientation of a legend."""
     vertical = 'vertical'
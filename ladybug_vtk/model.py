@@ -55,7 +55,7 @@ class Model:
         temp_folder = tempfile.mkdtemp()
         # The folder set by the user is the target folder
         target_folder = os.path.abspath(folder)
-        # Set a file path to move the .zip file to the target folder
+        # Set a file path for the vtkjs file in the target folder
         target_vtkjs_file = os.path.join(target_folder, file_name + '.vtkjs')
 
         # write every dataset
@@ -73,12 +73,9 @@ class Model:
         index_json.scene = scene
         index_json.to_json(temp_folder)
 
-        # zip as vtkjs
-        temp_vtkjs_file = convert_directory_to_zip_file(temp_folder, extension='vtkjs',
-                                                        move=False)
-
-        # Move the generated vtkjs to target folder
-        shutil.move(temp_vtkjs_file, target_vtkjs_file)
+        # zip as vtkjs directly into the target folder
+        convert_directory_to_zip_file(
+            temp_folder, move=False, zip_file_path=target_vtkjs_file)
 
         try:
             shutil.rmtree(temp_folder)
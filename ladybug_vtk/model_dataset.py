@@ -1,6 +1,7 @@
 """ModelDataSet object to control the representation of a Polydata object."""
 
-import pathlib
+import os
+import warnings
 from typing import List
 from .polydata import PolyData
 from .data_field_info import DataFieldInfo
@@ -118,9 +119,19 @@ class ModelDataSet:
 
     @ property
     def opacity(self) -> float:
-        """Visualization opacity."""
+        """Visualization opacity.
+
+        Opacity is the alpha value of the color and should be between 0 and 255.
+        """
         return self.color.a
 
+    @ opacity.setter
+    def opacity(self, value: int):
+        # colors can be shared between datasets so the color is copied before editing
+        color = self.color.duplicate()
+        color.a = value
+        self._color = color
+
     @ property
     def display_mode(self) -> DisplayMode:
         """Display model (AKA Representation) mode in VTK Glance viewer.
@@ -164,16 +175,17 @@ class ModelDataSet:
                 the name of the dataset.
         """
         sub_folder = sub_folder or self.name
-        target_folder = pathlib.Path(folder, sub_folder)
+        target_folder = os.path.join(folder, sub_folder)
 
         if len(self.data) == 0:
-            print(f'ModelDataSet: {self.name} has no data to be exported to folder.')
+            warnings.warn(
+                f'ModelDataSet: {self.name} has no data to be exported to folder.')
             return
         elif len(self.data) == 1:
             data = self.data[0]
         else:
             data = JoinedPolyData.from_polydata(self.data)
-        return data.to_folder(target_folder.as_posix())
+        return data.to_folder(target_folder)
 
     def as_data_set(self, url=None) -> DataSet:
         """Convert to a vtkjs DataSet object.
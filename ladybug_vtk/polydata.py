@@ -2,10 +2,12 @@
 
 import vtk
 import warnings
+import numpy as np
 from typing import Dict, List, Tuple, Union
 from .data_field_info import DataFieldInfo
 from .writer import write_to_folder, write_to_file
 from .legend_parameter import ColorSets
+from ._helper import to_vtk_array
 
 
 class PolyData(vtk.vtkPolyData):
@@ -35,6 +37,19 @@ class PolyData(vtk.vtkPolyData):
         else:
             raise ValueError(f'Unsupported input data type: {type(data)}')
 
+    @staticmethod
+    def _resolve_numpy_array(data: np.ndarray):
+        if np.issubdtype(data.dtype, np.floating):
+            array_type, dtype = vtk.vtkFloatArray, np.float32
+        elif np.issubdtype(data.dtype, np.integer) or data.dtype == np.bool_:
+            # booleans are stored as integers the same way as a list of booleans
+            array_type, dtype = vtk.vtkIntArray, np.int32
+        else:
+            raise ValueError(f'Unsupported input data type: {data.dtype}')
+        components = 1 if data.ndim == 1 else data.shape[1]
+        return to_vtk_array(
+            np.ascontiguousarray(data, dtype=dtype), array_type, components)
+
     @ property
     def data_fields(self) -> Dict[str, DataFieldInfo]:
         """Get data fields for this Polydata."""
@@ -47,8 +62,10 @@ class PolyData(vtk.vtkPolyData):
         Data can be added to cells or points. By default the data will be added to cells.
 
         Args:
-            data: A list of values. The length of the data should match the length of
-                DataCells or DataPoints in Polydata.
+            data: A list or a numpy array of values. The length of the data should
+                match the length of DataCells or DataPoints in Polydata. Numpy arrays
+                are copied to the VTK array in one go and float values are stored
+                as 32-bit floats.
             name: Name of data (e.g. Useful Daylight Autonomy.)
             cell: A Boolean to indicate if the data is per cell or per point. In
                 most cases except for sensor points that are loaded as sensors the data
@@ -60,27 +77,22 @@ class PolyData(vtk.vtkPolyData):
         assert name not in self._fields, \
             f'A data filed by name "{name}" already exist. Try a different name.'
 
-        if isinstance(data[0], (list, tuple)):
-            values = self._resolve_array_type(data[0][0])
-            values.SetNumberOfComponents(len(data[0]))
-            values.SetNumberOfTuples(len(data))
-            iterator = True
+        if isinstance(data, np.ndarray):
+            values = self._resolve_numpy_array(data)
         else:
-            values = self._resolve_array_type(data[0])
-            iterator = False
+            first = data[0][0] if isinstance(data[0], (list, tuple)) else data[0]
+            values = self._resolve_array_type(first)
+            if isinstance(values, vtk.vtkStringArray):
+                for d in data:
+                    values.InsertNextValue(d)
+            else:
+                # numbers and tuples of numbers are copied to VTK in one go
+                dtype = np.float32 if isinstance(values, vtk.vtkFloatArray) else np.int32
+                values = self._resolve_numpy_array(np.asarray(data, dtype=dtype))
 
         if name:
             values.SetName(name)
 
-        if iterator:
-            # NOTE: This is my (mostapha's) understanding from the original code for
-            # tuple data. This needs to be tested.
-            for d in data:
-                values.InsertNextValue(*d)
-        else:
-            for d in data:
-                values.InsertNextValue(d)
-
         if cell:
             self.GetCellData().AddArray(values)
         else:
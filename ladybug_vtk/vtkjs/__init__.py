@@ -4,6 +4,15 @@ from typing import Dict, List
 
 from pydantic import BaseModel, Field, validator
 
+from .schema import Camera, DataSetResource, DataSetActor, DataSetMapper, \
+    DataSetProperty, DataSet
+
+# the schema classes are re-exported here for backwards compatibility
+__all__ = [
+    'Camera', 'DataSetResource', 'DataSetActor', 'DataSetMapper', 'DataSetProperty',
+    'DataSet', 'color_by_type', 'ViewerSettings'
+]
+
 
 _COLORSET = {
     'Wall': [0.901, 0.705, 0.235, 1],
@@ -26,67 +35,6 @@ def color_by_type(face_type) -> List:
     return _COLORSET.get(face_type, [1, 1, 1, 1])
 
 
-class Camera(BaseModel):
-    """Camera in vtkjs viewer."""
-    focalPoint: List[float] = Field(
-        [2.5, 5, 1.5],
-        description='Camera focal point.', max_items=3, min_items=3
-    )
-    position: List[float] = Field(
-        [19.3843, -6.75305, 10.2683],
-        description='Camera position.', max_items=3, min_items=3
-    )
-    viewUp: List[float] = Field(
-        [-0.303079, 0.250543, 0.919441],
-        description='View up vector.', max_items=3, min_items=3
-    )
-
-
-class DataSetResource(BaseModel):
-    """Path to a data resource."""
-    url: str = Field(
-        ..., description='Relative path to data resource.'
-    )
-
-
-class DataSetActor(BaseModel):
-    """A Dataset actor."""
-    origin: List[float] = Field([0, 0, 0])
-    scale: List[float] = Field([1, 1, 1])
-    position: List[float] = Field([0, 0, 0])
-
-
-class DataSetMapper(BaseModel):
-    colorByArrayName: str = Field('')
-    colorMode: int = Field(0)
-    scalarMode: int = Field(4)
-
-
-class DataSetProperty(BaseModel):
-    representation: int = Field(2)
-    edgeVisibility: int = Field(0)
-    diffuseColor: List[float] = Field(
-        [0.8, 0.8, 0.8],
-        description='Surface color.', max_items=3, min_items=3
-    )
-    pointSize: int = Field(5)
-    opacity: float = Field(1)
-
-
-class DataSet(BaseModel):
-    """A VTKJS dataset."""
-    name: str = Field(..., description='DataSet name.')
-    type: str = Field('httpDataSetReader')  # I don't know enough about this field!
-    httpDataSetReader: DataSetResource = Field(...)
-    actor: DataSetActor = Field(DataSetActor())
-    actorRotation: List[float] = Field(
-        [0, 0, 0, 1],
-        description='Actor rotation axis.', max_items=4, min_items=4
-    )
-    mapper: DataSetMapper = Field(DataSetMapper())
-    property: DataSetProperty = Field(DataSetProperty())
-
-
 class ViewerSettings(BaseModel):
     version = 1
     background: List[float] = Field(
@@ -22,27 +22,34 @@ except ModuleNotFoundError:
 
 
 def convert_directory_to_zip_file(
-    directory_path: str, remove: bool = True, extension='zip', move=True
+    directory_path: str, remove: bool = True, extension='zip', move=True,
+    zip_file_path: str = None
         ) -> str:
 
     if os.path.isfile(directory_path):
         return
 
-    zip_file_path = f'{directory_path}.{extension}'
-    zf = zipfile.ZipFile(zip_file_path, mode='w')
+    zip_file_path = zip_file_path or f'{directory_path}.{extension}'
+    # write to a temporary file next to the target and move it in place once the
+    # archive is complete so a failure never leaves a truncated file behind
+    temp_zip_path = f'{zip_file_path}.tmp'
 
     try:
-        for dir_name, _, file_list in os.walk(directory_path):
-            for fname in file_list:
-                full_path = pathlib.Path(dir_name, fname)
-                rel_path = full_path.relative_to(directory_path)
-                zf.write(
-                    full_path.as_posix(),
-                    arcname=rel_path.as_posix(),
-                    compress_type=compression
-                )
-    finally:
-        zf.close()
+        with zipfile.ZipFile(temp_zip_path, mode='w') as zf:
+            for dir_name, _, file_list in os.walk(directory_path):
+                for fname in file_list:
+                    full_path = pathlib.Path(dir_name, fname)
+                    rel_path = full_path.relative_to(directory_path)
+                    zf.write(
+                        full_path.as_posix(),
+                        arcname=rel_path.as_posix(),
+                        compress_type=compression
+                    )
+        os.replace(temp_zip_path, zip_file_path)
+    except BaseException:
+        if os.path.isfile(temp_zip_path):
+            os.remove(temp_zip_path)
+        raise
 
     if remove:
         shutil.rmtree(directory_path)
@@ -65,19 +72,19 @@ def add_data_to_viewer(data_path, src_html_path=None):
     dstDir = os.path.dirname(data_path)
     dstHtmlPath = os.path.join(dstDir, "%s.html" % os.path.basename(data_path)[:-6])
 
-    # Extract data as base64
-    with open(data_path, 'rb') as data:
-        data_content = data.read()
-        base64Content = base64.b64encode(data_content)
-        base64Content = base64Content.decode().replace('\n', '')
-
     # Create new output file
     with open(src_html_path, mode="r", encoding="utf-8") as srcHtml:
         with open(dstHtmlPath, mode="w", encoding="utf-8") as dstHtml:
             for line in srcHtml:
                 if "<!–– insert ––>" in line:
                     dstHtml.write("<script>\n")
-                    dstHtml.write('var contentToLoad = "%s";\n\n' % base64Content)
+                    dstHtml.write('var contentToLoad = "')
+                    # Write data as base64 in chunks. The chunk size is a multiple of
+                    # 3 so the encoded chunks join without padding in between.
+                    with open(data_path, 'rb') as data:
+                        for chunk in iter(lambda: data.read(57 * 1024), b''):
+                            dstHtml.write(base64.b64encode(chunk).decode())
+                    dstHtml.write('";\n\n')
                     dstHtml.write("function _getContent() { return contentToLoad }</script>\n")
                     continue
                 dstHtml.write(line)
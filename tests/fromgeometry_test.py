@@ -1,12 +1,15 @@
 """testing functions in fromgeometry module."""
 
-from ladybug_geometry.geometry2d import Point2D, LineSegment2D
+import numpy as np
+
+from ladybug_geometry.geometry2d import Point2D, LineSegment2D, Polyline2D
 from ladybug_geometry.geometry3d import Point3D, Polyline3D, Arc3D, Vector3D, Mesh3D,\
     Face3D, Plane, LineSegment3D, Polyface3D, Cone, Sphere, Cylinder
 from ladybug_vtk.fromgeometry import from_point2d, from_points2d, from_line2d, \
-    from_point3d, from_points3d, from_line3d, from_polyline3d, from_arc3d, from_mesh3d,\
-    from_face3d, from_polyface3d, from_cone, from_sphere, from_cylinder, to_circle,\
-    to_text
+    from_polylines2d, from_point3d, from_points3d, from_points3d_array, from_line3d,\
+    from_polyline3d, from_polylines3d, from_arc3d, from_arcs3d, from_mesh3d,\
+    from_face3d, from_faces3d, from_polyface3d, from_cone, from_sphere, from_cylinder,\
+    to_circle, to_text, to_texts
 
 
 def test_from_point2d():
@@ -16,6 +19,7 @@ def test_from_point2d():
     assert polydata.GetNumberOfPoints() == 1
     assert polydata.GetNumberOfCells() == 1
     assert polydata.GetBounds() == (5.0, 5.0, 6.0, 6.0, 0.0, 0.0)
+    assert polydata.GetCell(0).GetPointId(0) == 0
 
 
 def test_from_points2d():
@@ -47,6 +51,16 @@ def test_from_line2d():
     assert polydata.GetBounds() == (0.0, 2.0, 0.0, 0.0, 0.0, 0.0)
 
 
+def test_from_polylines2d():
+    """Test from_polylines2d function."""
+    line = LineSegment2D.from_end_points(Point2D(0, 0), Point2D(5, 5))
+    polyline = Polyline2D([Point2D(1, 1), Point2D(10, 2), Point2D(11, 12)])
+    polydata = from_polylines2d([line, polyline])
+    assert polydata.GetNumberOfPoints() == 5
+    assert polydata.GetNumberOfLines() == 2
+    assert polydata.GetBounds() == (0, 11, 0, 12, 0, 0)
+
+
 def test_from_point3d():
     """Test point to Polydata conversion."""
     point = Point3D(5, 6, 7)
@@ -54,6 +68,7 @@ def test_from_point3d():
     assert polydata.GetNumberOfPoints() == 1
     assert polydata.GetNumberOfCells() == 1
     assert polydata.GetBounds() == (5.0, 5.0, 6.0, 6.0, 7.0, 7.0)
+    assert polydata.GetCell(0).GetPointId(0) == 0
 
 
 def test_from_points3d():
@@ -65,6 +80,16 @@ def test_from_points3d():
     assert polydata.GetBounds() == (5.0, 8.0, 6.0, 9.0, 7.0, 10.0)
 
 
+def test_from_points3d_array():
+    """Test an array of point coordinates to Polydata conversion."""
+    points = np.array([(5, 6, 7), (8, 9, 10), (11, 12, 13)])
+    polydata = from_points3d_array(points)
+    assert polydata.GetNumberOfPoints() == 3
+    assert polydata.GetNumberOfCells() == 1
+    assert polydata.GetNumberOfVerts() == 1
+    assert polydata.GetBounds() == (5.0, 11.0, 6.0, 12.0, 7.0, 13.0)
+
+
 def test_polyline_from_points3d():
     """Test a list of points to Polydata conversion as a joined polyline."""
     points = [Point3D(5, 6, 7), Point3D(8, 9, 10), Point3D(11, 12, 13)]
@@ -95,6 +120,17 @@ def test_from_polyline3d():
     assert polydata.GetBounds() == (5.0, 11.0, 6.0, 12.0, 7.0, 13.0)
 
 
+def test_from_polylines3d():
+    """Test a list of polylines to a single Polydata conversion."""
+    polyline = Polyline3D([Point3D(5, 6, 7), Point3D(8, 9, 10), Point3D(11, 12, 13)])
+    line = LineSegment3D.from_end_points(Point3D(0, 0, 2), Point3D(2, 0, 2))
+    polydata = from_polylines3d([polyline, line])
+    assert polydata.GetNumberOfPoints() == 5
+    assert polydata.GetNumberOfCells() == 2
+    assert polydata.GetNumberOfLines() == 2
+    assert polydata.GetBounds() == (0.0, 11.0, 0.0, 12.0, 2.0, 13.0)
+
+
 def test_from_arc3d():
     """Test arc to Polydata conversion."""
     arc = Arc3D.from_start_mid_end(
@@ -104,6 +140,25 @@ def test_from_arc3d():
     assert polydata.GetNumberOfCells() == 1
     assert polydata.GetNumberOfLines() == 1
 
+    # an arc has at least one segment
+    for resolution in (0, 1):
+        polydata = from_arc3d(arc, resolution)
+        assert polydata.GetNumberOfPoints() == 2
+        assert polydata.GetNumberOfLines() == 1
+        assert [round(v, 4) for v in polydata.GetPoint(1)] == [10.0, 0.0, 0.0]
+
+
+def test_from_arcs3d():
+    """Test a list of arcs to a single Polydata conversion."""
+    arc = Arc3D.from_start_mid_end(
+        Point3D(0, 0, 0), Point3D(5, 0, 20), Point3D(10, 0, 0))
+    polydata = from_arcs3d([arc, arc.move(Vector3D(0, 5, 0))], 10)
+    assert polydata.GetNumberOfPoints() == 22
+    assert polydata.GetNumberOfCells() == 2
+    assert polydata.GetNumberOfLines() == 2
+    bounds = [round(v, 2) for v in polydata.GetBounds()]
+    assert bounds == [-5.62, 15.62, 0.0, 5.0, 0.0, 20.0]
+
 
 def test_from_mesh3d():
     """Test mesh to Polydata conversion."""
@@ -128,6 +183,21 @@ def test_from_face3d():
     assert polydata.GetBounds() == (0.0, 2.0, 0.0, 2.0, 2.0, 2.0)
 
 
+def test_from_faces3d():
+    """Test faces to a single Polydata conversion."""
+    square = Face3D(
+        (Point3D(0, 0, 2), Point3D(0, 2, 2), Point3D(2, 2, 2), Point3D(2, 0, 2)))
+    l_shape = Face3D(
+        (Point3D(4, 0, 0), Point3D(8, 0, 0), Point3D(8, 2, 0), Point3D(6, 2, 0),
+         Point3D(6, 4, 0), Point3D(4, 4, 0)))
+    polydata = from_faces3d([square, l_shape])
+    concave = from_face3d(l_shape)
+    assert polydata.GetNumberOfPoints() == 4 + concave.GetNumberOfPoints()
+    assert polydata.GetNumberOfPolys() == 1 + concave.GetNumberOfPolys()
+    assert polydata.GetCell(1).GetPointId(0) >= 4
+    assert polydata.GetBounds() == (0.0, 8.0, 0.0, 4.0, 0.0, 2.0)
+
+
 def test_from_polyface3d():
     """Test polyface to Polydata conversion."""
     pts = [Point3D(0, 0, 0), Point3D(0, 2, 0), Point3D(2, 2, 0), Point3D(2, 0, 0),
@@ -167,6 +237,18 @@ def test_from_sphere():
     assert polydata.GetNumberOfPolys() == 1150
 
 
+def test_from_sphere_same_radius():
+    """Test that spheres with the same radius do not share their geometry."""
+    polydata_1 = from_sphere(Sphere(Point3D(0, 0, 0), 1))
+    polydata_2 = from_sphere(Sphere(Point3D(10, 20, 30), 1))
+    polydata_1.GetPoints().SetPoint(0, 100, 100, 100)
+    polydata_3 = from_sphere(Sphere(Point3D(0, 0, 0), 1))
+    bounds_2 = [round(v, 1) for v in polydata_2.GetBounds()]
+    bounds_3 = [round(v, 1) for v in polydata_3.GetBounds()]
+    assert bounds_2 == [9.0, 11.0, 19.0, 21.0, 29.0, 31.0]
+    assert bounds_3 == [-1.0, 1.0, -1.0, 1.0, -1.0, 1.0]
+
+
 def test_from_cylinder():
     """Test cylinder to Polydata conversion."""
     center = Point3D(2, 0, 2)
@@ -195,3 +277,20 @@ def test_to_text():
     assert round(text_polydata.GetBounds()[0], 2) == 5.54
     assert round(text_polydata.GetBounds()[2], 2) == 4.82
     assert round(text_polydata.GetBounds()[4], 2) == 5.0
+
+
+def test_to_texts():
+    """Test to_texts function."""
+    points = [Point3D(5, 5, 5), Point3D(20, 5, 5)]
+    texts_polydata = to_texts(['Hello', 'World!'], points)
+    hello = to_text('Hello', points[0])
+    world = to_text('World!', points[1])
+    assert texts_polydata.GetNumberOfPoints() == \
+        hello.GetNumberOfPoints() + world.GetNumberOfPoints()
+    assert texts_polydata.GetNumberOfCells() == \
+        hello.GetNumberOfCells() + world.GetNumberOfCells()
+    assert texts_polydata.GetBounds()[0] == hello.GetBounds()[0]
+    assert texts_polydata.GetBounds()[1] == world.GetBounds()[1]
+
+    moved_polydata = to_texts(['Hello'], [Point3D(0, 0, 0)], offset=Vector3D(5, 5, 5))
+    assert moved_polydata.GetBounds() == hello.GetBounds()
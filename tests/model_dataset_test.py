@@ -0,0 +1,19 @@
+"""testing the ModelDataSet object."""
+
+from ladybug.color import Color
+
+from ladybug_vtk.model_dataset import ModelDataSet
+
+
+def test_opacity():
+    """Test setting the opacity of a dataset."""
+    color = Color(255, 0, 0, 255)
+    dataset = ModelDataSet('lines', color=color)
+    assert dataset.as_data_set().property.opacity == 1
+
+    dataset.opacity = 51
+    assert dataset.opacity == 51
+    # the input color should not be edited in place
+    assert color.a == 255
+    assert dataset.color == Color(255, 0, 0, 51)
+    assert dataset.as_data_set().property.opacity == 0.2
@@ -0,0 +1,77 @@
+"""testing the PolyData object."""
+
+import vtk
+import numpy as np
+from vtk.util.numpy_support import vtk_to_numpy
+
+from ladybug_vtk.fromgeometry import from_points3d_array
+
+
+def test_add_data_tuples():
+    """Test adding a list of tuples as multi-component data."""
+    polydata = from_points3d_array(np.zeros((3, 3)))
+    polydata.add_data([(1.0, 0.0, 0.5), (0.0, 1.0, 0.5), (0.0, 0.0, 1.0)],
+                      'vectors', cell=False)
+    values = polydata.GetPointData().GetArray('vectors')
+    assert isinstance(values, vtk.vtkFloatArray)
+    assert values.GetNumberOfComponents() == 3
+    assert values.GetNumberOfTuples() == 3
+    assert values.GetTuple3(1) == (0.0, 1.0, 0.5)
+
+
+def test_add_data_mixed_numbers():
+    """Test adding a list of integers and floats.
+
+    The type of the first value sets the type of the data.
+    """
+    polydata = from_points3d_array(np.zeros((3, 3)))
+    polydata.add_data([1, 2.5, 3], 'ints', cell=False)
+    values = polydata.GetPointData().GetArray('ints')
+    assert isinstance(values, vtk.vtkIntArray)
+    assert vtk_to_numpy(values).tolist() == [1, 2, 3]
+
+    polydata.add_data([1.5, 2, 3], 'floats', cell=False)
+    values = polydata.GetPointData().GetArray('floats')
+    assert isinstance(values, vtk.vtkFloatArray)
+    assert vtk_to_numpy(values).tolist() == [1.5, 2.0, 3.0]
+
+
+def test_add_data_float64_array():
+    """Test adding a float64 numpy array."""
+    polydata = from_points3d_array(np.zeros((3, 3)))
+    polydata.add_data(np.array([0.25, 1.5, 2.75], dtype=np.float64), 'values')
+    values = polydata.GetCellData().GetArray('values')
+    assert isinstance(values, vtk.vtkFloatArray)
+    assert values.GetNumberOfComponents() == 1
+    assert vtk_to_numpy(values).tolist() == [0.25, 1.5, 2.75]
+
+
+def test_add_data_bool():
+    """Test adding booleans as a list and as a numpy array."""
+    polydata = from_points3d_array(np.zeros((3, 3)))
+    polydata.add_data([True, False, True], 'list', cell=False)
+    polydata.add_data(np.array([True, False, True]), 'array', cell=False)
+    for name in ('list', 'array'):
+        values = polydata.GetPointData().GetArray(name)
+        assert isinstance(values, vtk.vtkIntArray)
+        assert vtk_to_numpy(values).tolist() == [1, 0, 1]
+
+
+def test_add_data_int_array():
+    """Test adding an int64 numpy array."""
+    polydata = from_points3d_array(np.zeros((4, 3)))
+    polydata.add_data(np.arange(4, dtype=np.int64), 'ids', cell=False)
+    values = polydata.GetPointData().GetArray('ids')
+    assert isinstance(values, vtk.vtkIntArray)
+    assert vtk_to_numpy(values).tolist() == [0, 1, 2, 3]
+
+
+def test_add_data_strided_array():
+    """Test adding a non-contiguous numpy array."""
+    polydata = from_points3d_array(np.zeros((3, 3)))
+    data = np.arange(6, dtype=np.float64)[::2]
+    assert not data.flags['C_CONTIGUOUS']
+    polydata.add_data(data, 'values', cell=False)
+    values = polydata.GetPointData().GetArray('values')
+    assert isinstance(values, vtk.vtkFloatArray)
+    assert vtk_to_numpy(values).tolist() == [0.0, 2.0, 4.0]
@@ -1,4 +1,5 @@
 from ladybug.sunpath import Sunpath
+from ladybug_vtk._extend_sunpath import _compass_polydata, _monthly_polydata
 
 
 def test_sunpath(temp_folder, epw):
@@ -9,3 +10,34 @@ def test_sunpath(temp_folder, epw):
                              epw.dry_bulb_temperature]
                        )
     assert path.name == 'sunpath.vtkjs'
+
+
+def test_sunpath_monthly_arcs_resolution(epw):
+    sp = Sunpath.from_location(epw.location)
+    # 12 monthly arcs with resolution + 1 points each
+    polydata = _monthly_polydata(sp, radius=100, make_2d=False)
+    assert polydata.GetNumberOfPoints() == 12 * 51
+    polydata = _monthly_polydata(sp, radius=100, make_2d=False, arc_resolution=10)
+    assert polydata.GetNumberOfPoints() == 12 * 11
+    assert polydata.GetNumberOfLines() == 12
+    # each arc has at least one segment
+    for arc_resolution in (0, 1):
+        polydata = _monthly_polydata(
+            sp, radius=100, make_2d=False, arc_resolution=arc_resolution)
+        assert polydata.GetNumberOfPoints() == 12 * 2
+        assert polydata.GetNumberOfLines() == 12
+
+
+def test_sunpath_compass_is_not_shared():
+    compass_1 = _compass_polydata(100, 0)
+    compass_2 = _compass_polydata(100, 0)
+    for polydata_1, polydata_2 in zip(compass_1, compass_2):
+        assert polydata_1 is not polydata_2
+        assert polydata_1.GetNumberOfPoints() == polydata_2.GetNumberOfPoints()
+
+    # adding data to one export should not change the next one
+    circles = compass_1[0]
+    circles.add_data([1.0] * circles.GetNumberOfPoints(), 'values', cell=False)
+    compass_3 = _compass_polydata(100, 0)
+    assert compass_3[0].GetPointData().GetNumberOfArrays() == 0
+    assert compass_3[0].data_fields == {}